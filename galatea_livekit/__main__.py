@@ -64,33 +64,55 @@ class GalateaVoiceAgent(Agent):
     ):
         return Agent.default.llm_node(self, chat_ctx, tools, model_settings)
 
+# Parsed workspace cache keyed by file mtimes: sessions start often but the
+# workspace files rarely change, so skip re-reading/re-parsing when they haven't.
+_workspace_cache: dict | None = None
+_workspace_mtimes: tuple | None = None
+
+def _mtime_ns(path: Path) -> int:
+    """Return st_mtime_ns for path, or -1 if it doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
 def load_workspace() -> dict:
-    """Load config.json, SOUL.md, and SKILLS.md from the .galatea directory."""
+    """Load config.json, SOUL.md, and SKILLS.md from the .galatea directory.
+
+    Cached in memory; files are only re-read when their mtime changes.
+    """
+    global _workspace_cache, _workspace_mtimes
     config_path = PathManager.get_config_path()
     soul_path = PathManager.get_soul_path()
     skills_path = PathManager.get_skills_path()
-    
+
+    mtimes = (_mtime_ns(config_path), _mtime_ns(soul_path), _mtime_ns(skills_path))
+    if _workspace_cache is not None and mtimes == _workspace_mtimes:
+        return _workspace_cache
+
     config = {}
-    if config_path.exists():
+    if mtimes[0] != -1:
         try:
             config = json.loads(config_path.read_text(encoding="utf-8"))
         except Exception as e:
             logger.error(f"Failed to load config.json: {e}")
 
-    soul = soul_path.read_text(encoding="utf-8") if soul_path.exists() else "You are a helpful assistant."
-    skills = skills_path.read_text(encoding="utf-8") if skills_path.exists() else ""
+    soul = soul_path.read_text(encoding="utf-8") if mtimes[1] != -1 else "You are a helpful assistant."
+    skills = skills_path.read_text(encoding="utf-8") if mtimes[2] != -1 else ""
 
-    return {
+    _workspace_cache = {
         "config": config,
         "soul": soul,
         "skills": skills,
     }
+    _workspace_mtimes = mtimes
+    return _workspace_cache
 
 server = AgentServer()
 
 @server.rtc_session()
 async def entrypoint(ctx: JobContext):
-    logger.info(f"Starting Galatea Voice Session: {ctx.room.name}")
+    logger.info("Starting Galatea Voice Session: %s", ctx.room.name)
     
     # 1. Load Workspace
     workspace = load_workspace()
@@ -109,7 +131,7 @@ async def entrypoint(ctx: JobContext):
     async def command_body(
         text: Annotated[str, "The command or intent to send to the internal system"]
     ) -> str:
-        logger.info(f"Tool Call: command_body text='{text}'")
+        logger.info("Tool Call: command_body text='%s'", text)
         msg = InboundMessage(
             source="voice",
             user_id="user",
@@ -153,7 +175,7 @@ async def entrypoint(ctx: JobContext):
     async def _listen_outbound():
         async for msg in bus.subscribe_outbound("voice"):
             if msg.chat_id == chat_id:
-                logger.info(f"Speaking outbound message from bus: {msg.text}")
+                logger.info("Speaking outbound message from bus: %s", msg.text)
                 await session.say(msg.text)
 
     asyncio.create_task(_listen_outbound())
@@ -173,7 +195,7 @@ async def entrypoint(ctx: JobContext):
     await session.start(agent, room=ctx.room)
     
     # Ready and listening without robotic greeting
-    logger.info(f"{agent_name} is now connected and listening.")
+    logger.info("%s is now connected and listening.", agent_name)
 
 if __name__ == "__main__":
     if len(sys.argv) == 1:
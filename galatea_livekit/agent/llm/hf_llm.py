@@ -83,7 +83,7 @@ class HFLLMStream(LLMStream):
                 content = " ".join(str(c) for c in content if isinstance(c, str))
             parts.append(f"{role.capitalize()}: {content}")
         prompt = "\n".join(parts) + "\nAssistant:"
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         try:
             text = await loop.run_in_executor(
                 None,
@@ -38,6 +38,7 @@ from plugins import (
     SileroTTS,
     SileroSTT,
 )
+from galatea_livekit.utils.keys import resolve_api_key
 
 
 load_dotenv()
@@ -90,6 +91,10 @@ Use one or two tags per reply when it fits. These only work with Eleven v3; earl
 # Project root for resolving relative file paths
 SCRIPT_DIR = Path(__file__).resolve().parent
 
+# File-backed prompts are re-resolved on every job entry; cache the text keyed by
+# mtime so unchanged prompt files cost one stat instead of a full read + decode.
+_prompt_file_cache: dict[str, tuple[int, str]] = {}
+
 
 def resolve_prompt(prompt_spec: str | dict) -> str:
     """
@@ -124,7 +129,13 @@ def resolve_prompt(prompt_spec: str | dict) -> str:
         if not path.is_absolute():
             path = SCRIPT_DIR / path_str
         try:
-            return path.read_text(encoding="utf-8", errors="replace").strip()
+            mtime = path.stat().st_mtime_ns
+            cached = _prompt_file_cache.get(str(path))
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+            text = path.read_text(encoding="utf-8", errors="replace").strip()
+            _prompt_file_cache[str(path)] = (mtime, text)
+            return text
         except Exception as e:
             logger.warning("Failed to read prompt from file %s: %s", path, e)
             return "You are a helpful assistant."
@@ -175,12 +186,7 @@ def create_agent_llm(cfg: dict):
     if provider == "google":
         return google.LLM(model=model)
     if provider == "anthropic":
-        api_key = (
-            (os.getenv("ANTHROPIC_API_KEY") or os.getenv("anthropic_api_key") or "")
-            .strip()
-            .strip('"')
-            .strip("'")
-        )
+        api_key = resolve_api_key(("ANTHROPIC_API_KEY", "anthropic_api_key"))
         if not api_key:
             raise ValueError(
                 "ANTHROPIC_API_KEY is not set. Set it in .env for Anthropic/Claude."
@@ -190,7 +196,7 @@ def create_agent_llm(cfg: dict):
     # DeepSeek uses a dedicated API base URL and its own API key (OpenAI-compatible API)
     if provider == "deepseek":
         base_url = base_url or "https://api.deepseek.com"
-        api_key = (os.getenv("DEEPSEEK_API_KEY") or "").strip().strip('"').strip("'")
+        api_key = resolve_api_key(("DEEPSEEK_API_KEY",))
         if not api_key:
             raise ValueError(
                 "DEEPSEEK_API_KEY is not set. Set it in .env when using DeepSeek (e.g. Wei). "
@@ -1,3 +1,4 @@
+import json
 from typing import Any, List, Optional
 from livekit.agents import function_tool
 from galatea_livekit.utils.bucket import BucketStore
@@ -5,7 +6,6 @@ from galatea_livekit.utils.bucket import BucketStore
 @function_tool
 def bucket_put(bucket: str, key: str, data: str) -> str:
     """Put an object into a specific bucket. Data should be a JSON-parseable string."""
-    import json
     try:
         parsed_data = json.loads(data)
         store = BucketStore(bucket)
@@ -17,7 +17,6 @@ def bucket_put(bucket: str, key: str, data: str) -> str:
 @function_tool
 def bucket_get(bucket: str, key: str) -> str:
     """Retrieve an object from a bucket."""
-    import json
     try:
         store = BucketStore(bucket)
         data = store.get(key)
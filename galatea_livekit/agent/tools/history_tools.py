@@ -1,3 +1,5 @@
+import asyncio
+import json
 import uuid
 from livekit.agents import function_tool
 from galatea_livekit.session.history import HistoryManager
@@ -6,7 +8,6 @@ from galatea_livekit.bus.events import HistoryRequest
 @function_tool
 def query_local_history(channel: str, chat_id: str, limit: int = 50) -> str:
     """Query the local database for message history of a specific chat."""
-    import json
     try:
         mgr = HistoryManager()
         history = mgr.get_history(channel, chat_id, limit)
@@ -31,7 +32,6 @@ def request_channel_history(channel: str, chat_id: str, limit: int = 100) -> str
             request_id=str(uuid.uuid4())
         )
         await GLOBAL_BUS.publish_history_request(req)
-        
-    import asyncio
+
     asyncio.create_task(_request())
     return f"History request sent to {channel} for {chat_id}. Response will be sent to the message bus."
@@ -3,16 +3,42 @@ Inflection AI tool: call Inflection (e.g. Pi) for a reply. Available to all agen
 """
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
+import re
 from typing import Any, List, Optional
 
 import aiohttp
 
+from galatea_livekit.utils.cache import cache
+
 logger = logging.getLogger("inflection-tool")
 
+# Identical questions are answered from the shared cache for a short window
+# instead of re-billing the API; keyed on (model, instruction, normalized text).
+_CACHE_TTL_SECONDS = 300
+_WS = re.compile(r"\s+")
+
+
+def _cache_key(model: str, system_instruction: Optional[str], user_message: str) -> str:
+    norm = _WS.sub(" ", str(user_message).strip().lower())
+    raw = f"{model}|{system_instruction or ''}|{norm}".encode()
+    return "inflection:" + hashlib.blake2b(raw, digest_size=16).hexdigest()
+
 INFLECTION_API_URL = "https://api.inflection.ai/external/api/inference"
 
+# Shared session so repeated calls reuse the connection pool instead of paying
+# a DNS lookup + TLS handshake per request.
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def _get_session() -> aiohttp.ClientSession:
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+    return _session
+
 
 async def get_inflection_response(
     user_message: str,
@@ -29,6 +55,11 @@ async def get_inflection_response(
     if not key:
         return "Inflection AI is not configured (set INFLECTION_AI_KEY)."
 
+    cache_key = _cache_key(model, system_instruction, user_message)
+    cached = cache.get(cache_key)
+    if cached:
+        return cached
+
     context_data: List[dict[str, str]] = []
     if system_instruction:
         context_data.append({"text": f"System Instructions: {system_instruction}", "type": "Human"})
@@ -37,18 +68,20 @@ async def get_inflection_response(
     payload: dict[str, Any] = {"context": context_data, "config": model}
     headers = {"Authorization": f"Bearer {key}", "Content-Type": "application/json"}
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(INFLECTION_API_URL, json=payload, headers=headers) as resp:
-            if resp.status != 200:
-                err_text = await resp.text()
-                logger.error("Inflection API error: %s - %s", resp.status, err_text)
-                return "I could not get a response from Inflection right now."
-            try:
-                data = await resp.json()
-            except Exception as e:
-                logger.error("Inflection response parse error: %s", e)
-                return "I could not read the Inflection response."
+    session = _get_session()
+    async with session.post(INFLECTION_API_URL, json=payload, headers=headers) as resp:
+        if resp.status != 200:
+            err_text = await resp.text()
+            logger.error("Inflection API error: %s - %s", resp.status, err_text)
+            return "I could not get a response from Inflection right now."
+        try:
+            data = await resp.json()
+        except Exception as e:
+            logger.error("Inflection response parse error: %s", e)
+            return "I could not read the Inflection response."
     text = data.get("text") or data.get("output") or data.get("response") or ""
     if isinstance(text, list):
         text = " ".join(str(t) for t in text)
-    return (text or "I have nothing to add.").strip()
+    reply = (text or "I have nothing to add.").strip()
+    cache.set(cache_key, reply, expire=_CACHE_TTL_SECONDS)
+    return reply
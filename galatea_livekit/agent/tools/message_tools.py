@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from livekit.agents import function_tool
 from galatea_livekit.bus.events import OutboundMessage
@@ -22,7 +23,6 @@ def send_message(target: str, user_id: str, chat_id: str, text: str) -> str:
             text=text
         )
         await GLOBAL_BUS.publish_outbound(outbound)
-    
-    import asyncio
+
     asyncio.create_task(_send())
     return f"Message queued for {target}:{chat_id}"
@@ -1,21 +1,56 @@
 import asyncio
+import atexit
+import concurrent.futures
 import sqlite3
 import json
 import logging
+import threading
 from pathlib import Path
 from typing import AsyncGenerator, Optional, Dict, Any
 from .events import InboundMessage, OutboundMessage, HistoryRequest
 from galatea_livekit.utils.paths import PathManager
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger("sqlite-bus")
 
+# Dedicated pool for bus DB work so bus traffic neither queues behind nor starves
+# other users of the shared default executor
+_DB_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="galatea-bus")
+atexit.register(_DB_EXECUTOR.shutdown, wait=False)
+
+def _json_dumps(obj: Any) -> str:
+    # orjson is a C encoder, much faster than stdlib json on the per-message hot path
+    if orjson:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+def _json_loads(raw) -> Any:
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 class MessageBus:
     def __init__(self, db_path: Optional[str] = None):
         self.db_path = db_path or PathManager.get_db_path("galatea_bus")
+        # One long-lived connection instead of a connect per operation: the
+        # subscribe loops poll every 100ms, and each connect re-paid open/close
+        # and SQLite's per-connection setup. check_same_thread=False because
+        # operations run on _DB_EXECUTOR threads; _conn_lock serializes access.
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.Lock()
         self._init_db()
 
+    def _get_conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        return self._conn
+
     def _init_db(self):
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn_lock:
+            conn = self._get_conn()
             # Table for inbound messages
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS inbound (
@@ -62,13 +97,14 @@ class MessageBus:
                 "media_type": msg.media_type,
                 "payload": msg.payload
             }
-            with sqlite3.connect(self.db_path) as conn:
+            with self._conn_lock:
+                conn = self._get_conn()
                 conn.execute(
                     "INSERT INTO inbound (source, user_id, chat_id, payload) VALUES (?, ?, ?, ?)",
-                    (msg.source, msg.user_id, msg.chat_id, json.dumps(payload))
+                    (msg.source, msg.user_id, msg.chat_id, _json_dumps(payload))
                 )
                 conn.commit()
-        await asyncio.get_event_loop().run_in_executor(None, _insert)
+        await asyncio.get_running_loop().run_in_executor(_DB_EXECUTOR, _insert)
 
     async def publish_outbound(self, msg: OutboundMessage):
         def _insert():
@@ -78,23 +114,25 @@ class MessageBus:
                 "media_type": msg.media_type,
                 "payload": msg.payload
             }
-            with sqlite3.connect(self.db_path) as conn:
+            with self._conn_lock:
+                conn = self._get_conn()
                 conn.execute(
                     "INSERT INTO outbound (target, user_id, chat_id, payload) VALUES (?, ?, ?, ?)",
-                    (msg.target, msg.user_id, msg.chat_id, json.dumps(payload))
+                    (msg.target, msg.user_id, msg.chat_id, _json_dumps(payload))
                 )
                 conn.commit()
-        await asyncio.get_event_loop().run_in_executor(None, _insert)
+        await asyncio.get_running_loop().run_in_executor(_DB_EXECUTOR, _insert)
 
     async def publish_history_request(self, req: HistoryRequest):
         def _insert():
-            with sqlite3.connect(self.db_path) as conn:
+            with self._conn_lock:
+                conn = self._get_conn()
                 conn.execute(
                     "INSERT INTO history_requests (channel, chat_id, limit_count, request_id) VALUES (?, ?, ?, ?)",
                     (req.channel, req.chat_id, req.limit, req.request_id)
                 )
                 conn.commit()
-        await asyncio.get_event_loop().run_in_executor(None, _insert)
+        await asyncio.get_running_loop().run_in_executor(_DB_EXECUTOR, _insert)
 
     async def subscribe_inbound(self) -> AsyncGenerator[InboundMessage, None]:
         while True:
@@ -106,14 +144,15 @@ class MessageBus:
 
     async def _get_next_inbound(self) -> Optional[InboundMessage]:
         def _query():
-            with sqlite3.connect(self.db_path) as conn:
+            with self._conn_lock:
+                conn = self._get_conn()
                 cursor = conn.cursor()
                 cursor.execute("SELECT id, source, user_id, chat_id, payload FROM inbound WHERE processed = 0 ORDER BY id LIMIT 1")
                 row = cursor.fetchone()
                 if row:
                     cursor.execute("UPDATE inbound SET processed = 1 WHERE id = ?", (row[0],))
                     conn.commit()
-                    payload = json.loads(row[4])
+                    payload = _json_loads(row[4])
                     return InboundMessage(
                         source=row[1],
                         user_id=row[2],
@@ -124,7 +163,7 @@ class MessageBus:
                         payload=payload.get("payload", {})
                     )
                 return None
-        return await asyncio.get_event_loop().run_in_executor(None, _query)
+        return await asyncio.get_running_loop().run_in_executor(_DB_EXECUTOR, _query)
 
     async def subscribe_outbound(self, channel: str) -> AsyncGenerator[OutboundMessage, None]:
         while True:
@@ -136,14 +175,15 @@ class MessageBus:
 
     async def _get_next_outbound(self, channel: str) -> Optional[OutboundMessage]:
         def _query():
-            with sqlite3.connect(self.db_path) as conn:
+            with self._conn_lock:
+                conn = self._get_conn()
                 cursor = conn.cursor()
                 cursor.execute("SELECT id, target, user_id, chat_id, payload FROM outbound WHERE processed = 0 AND target = ? ORDER BY id LIMIT 1", (channel,))
                 row = cursor.fetchone()
                 if row:
                     cursor.execute("UPDATE outbound SET processed = 1 WHERE id = ?", (row[0],))
                     conn.commit()
-                    payload = json.loads(row[4])
+                    payload = _json_loads(row[4])
                     return OutboundMessage(
                         target=row[1],
                         user_id=row[2],
@@ -154,7 +194,7 @@ class MessageBus:
                         payload=payload.get("payload", {})
                     )
                 return None
-        return await asyncio.get_event_loop().run_in_executor(None, _query)
+        return await asyncio.get_running_loop().run_in_executor(_DB_EXECUTOR, _query)
 
     async def subscribe_history_requests(self, channel: str) -> AsyncGenerator[HistoryRequest, None]:
         while True:
@@ -166,7 +206,8 @@ class MessageBus:
 
     async def _get_next_history_request(self, channel: str) -> Optional[HistoryRequest]:
         def _query():
-            with sqlite3.connect(self.db_path) as conn:
+            with self._conn_lock:
+                conn = self._get_conn()
                 cursor = conn.cursor()
                 cursor.execute("SELECT id, channel, chat_id, limit_count, request_id FROM history_requests WHERE processed = 0 AND channel = ? ORDER BY id LIMIT 1", (channel,))
                 row = cursor.fetchone()
@@ -180,4 +221,4 @@ class MessageBus:
                         request_id=row[4]
                     )
                 return None
-        return await asyncio.get_event_loop().run_in_executor(None, _query)
+        return await asyncio.get_running_loop().run_in_executor(_DB_EXECUTOR, _query)
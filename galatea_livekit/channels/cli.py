@@ -23,7 +23,7 @@ class CLIChannel:
         while True:
             # We use aioconsole or a simple loop for input
             # To avoid blocking the event loop, we use run_in_executor
-            user_input = await asyncio.get_event_loop().run_in_executor(None, sys.stdin.readline)
+            user_input = await asyncio.get_running_loop().run_in_executor(None, sys.stdin.readline)
             user_input = user_input.strip()
             
             if user_input.lower() in ("exit", "quit"):
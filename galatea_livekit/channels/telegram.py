@@ -72,11 +72,11 @@ class TelegramChannel:
                     parse_mode=ParseMode.MARKDOWN
                 )
             except Exception as e:
-                logger.error(f"Failed to send message to Telegram: {e}")
+                logger.error("Failed to send message to Telegram: %s", e)
 
     async def _listen_history_requests(self):
         async for req in self._bus.subscribe_history_requests("telegram"):
-            logger.info(f"Processing history request for chat_id={req.chat_id}, limit={req.limit}")
+            logger.info("Processing history request for chat_id=%s, limit=%s", req.chat_id, req.limit)
             try:
                 # Note: Telegram Bot API has limitations on fetching history. 
                 # Usually bots only see messages sent to them while they are active.
@@ -92,4 +92,4 @@ class TelegramChannel:
                 )
                 await self._bus.publish_inbound(inbound)
             except Exception as e:
-                logger.error(f"Failed to process history request: {e}")
+                logger.error("Failed to process history request: %s", e)
@@ -19,16 +19,19 @@ class BaseProvider(ABC):
         self.name = name
         self.api_key = api_key
         self.models: List[Model] = []
+        self._models_by_id: Dict[str, Model] = {}
+        self._indexed_models: Optional[List[Model]] = None
 
     @abstractmethod
     async def validate(self) -> bool:
         pass
 
     def get_model(self, model_id: str) -> Optional[Model]:
-        for model in self.models:
-            if model.id == model_id:
-                return model
-        return None
+        # O(1) lookup via an id index, rebuilt when the models list changes
+        if self._indexed_models is not self.models or len(self._models_by_id) != len(self.models):
+            self._models_by_id = {m.id: m for m in self.models}
+            self._indexed_models = self.models
+        return self._models_by_id.get(model_id)
 
     def list_models(self) -> List[Model]:
         return self.models
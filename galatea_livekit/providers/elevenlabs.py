@@ -2,25 +2,27 @@ import logging
 import os
 from typing import Optional, List
 from livekit.plugins import elevenlabs
+from galatea_livekit.utils.keys import resolve_api_key
 from .base import BaseProvider, Model
 
 logger = logging.getLogger("provider-elevenlabs")
 
+# ELEVEN_API_KEY from .env as per docs; resolution is memoized per process
+_ELEVEN_ENV_NAMES = ("ELEVEN_API_KEY", "ELEVENLABS_API_KEY")
+
 class ElevenLabsTTS(elevenlabs.TTS):
     def __init__(self, *, voice_id: str = "EXAVITQu4vr4xnSDxMaL", model: str = "eleven_multilingual_v2", **kwargs):
-        # Use ELEVEN_API_KEY from .env as per docs
-        api_key = os.getenv("ELEVEN_API_KEY") or os.getenv("ELEVENLABS_API_KEY")
+        api_key = resolve_api_key(_ELEVEN_ENV_NAMES)
         super().__init__(model=model, voice_id=voice_id, api_key=api_key, **kwargs)
 
 class ElevenLabsSTT(elevenlabs.STT):
     def __init__(self, *, model_id: str = "scribe_v2_realtime"):
-        # Use ELEVEN_API_KEY from .env as per docs
-        api_key = os.getenv("ELEVEN_API_KEY") or os.getenv("ELEVENLABS_API_KEY")
+        api_key = resolve_api_key(_ELEVEN_ENV_NAMES)
         super().__init__(model_id=model_id, api_key=api_key)
 
 class ElevenLabsProvider(BaseProvider):
     def __init__(self, api_key: Optional[str] = None):
-        super().__init__("ElevenLabs", api_key or os.getenv("ELEVEN_API_KEY"))
+        super().__init__("ElevenLabs", resolve_api_key(_ELEVEN_ENV_NAMES, api_key))
         self.models = [
             Model("eleven_multilingual_v2", "Multilingual V2", ["text"], ["voice"], "elevenlabs", is_instruct=False, base="custom"),
             Model("eleven_turbo_v2_5", "Turbo V2.5", ["text"], ["voice"], "elevenlabs", is_instruct=False, base="custom"),
@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, Optional, Dict
 from .base import BaseProvider
 from .openai import OpenAIProvider
@@ -21,10 +22,10 @@ class ProviderManager:
         return list(self.providers.keys())
 
     async def validate_all(self) -> Dict[str, bool]:
-        results = {}
-        for name, provider in self.providers.items():
-            results[name] = await provider.validate()
-        return results
+        # Validations are independent network checks; run them concurrently
+        names = list(self.providers.keys())
+        checks = await asyncio.gather(*(self.providers[n].validate() for n in names))
+        return dict(zip(names, checks))
 
 # Singleton instance
 manager = ProviderManager()
@@ -8,31 +8,28 @@ def update_model_csvs():
     models_path = root / "models.csv"
     media_path = root / "model_media.csv"
 
+    # Single pass over providers/models builds rows for both CSVs at once
+    model_rows = []
+    media_rows = []
+    for p_name in manager.list_providers():
+        provider = manager.get_provider(p_name)
+        for model in provider.list_models():
+            model_rows.append(
+                [model.id, model.provider, str(model.is_instruct).lower(), model.base, str(model.is_deprecated).lower()]
+            )
+            media_rows.extend([model.id, m, "in"] for m in model.input_media)
+            media_rows.extend([model.id, m, "out"] for m in model.output_media)
+
     # 1. models.csv: modelid, provider, is_instruct, base, is_deprecated
     with open(models_path, mode='w', newline='', encoding='utf-8') as f:
         writer = csv.writer(f)
         writer.writerow(["modelid", "provider", "is_instruct", "base", "is_deprecated"])
-        for p_name in manager.list_providers():
-            provider = manager.get_provider(p_name)
-            for model in provider.list_models():
-                writer.writerow([
-                    model.id, 
-                    model.provider, 
-                    str(model.is_instruct).lower(),
-                    model.base,
-                    str(model.is_deprecated).lower()
-                ])
+        writer.writerows(model_rows)
 
     # 2. model_media.csv: modelid, media, type
     with open(media_path, mode='w', newline='', encoding='utf-8') as f:
         writer = csv.writer(f)
         writer.writerow(["modelid", "media", "type"])
-        for p_name in manager.list_providers():
-            provider = manager.get_provider(p_name)
-            for model in provider.list_models():
-                for m in model.input_media:
-                    writer.writerow([model.id, m, "in"])
-                for m in model.output_media:
-                    writer.writerow([model.id, m, "out"])
+        writer.writerows(media_rows)
 
     return str(models_path), str(media_path)
@@ -1,6 +1,7 @@
 import sqlite3
 import json
 import logging
+import threading
 from pathlib import Path
 from typing import List, Dict, Any
 from galatea_livekit.utils.paths import PathManager
@@ -10,10 +11,20 @@ logger = logging.getLogger("galatea-history")
 class HistoryManager:
     def __init__(self, db_path: str = None):
         self.db_path = db_path or PathManager.get_db_path("history")
+        # Long-lived connection: reconnecting per call re-parsed every statement,
+        # while a persistent connection reuses SQLite's compiled-statement cache.
+        self._conn = None
+        self._conn_lock = threading.Lock()
         self._init_db()
 
+    def _get_conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        return self._conn
+
     def _init_db(self):
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn_lock:
+            conn = self._get_conn()
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS messages (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -29,7 +40,8 @@ class HistoryManager:
             conn.commit()
 
     def add_entry(self, channel: str, chat_id: str, user_id: str, role: str, text: str, payload: Dict = None):
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn_lock:
+            conn = self._get_conn()
             conn.execute(
                 "INSERT INTO messages (channel, chat_id, user_id, role, text, payload) VALUES (?, ?, ?, ?, ?, ?)",
                 (channel, chat_id, user_id, role, text, json.dumps(payload or {}))
@@ -37,7 +49,8 @@ class HistoryManager:
             conn.commit()
 
     def get_history(self, channel: str, chat_id: str, limit: int = 100) -> List[Dict[str, Any]]:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn_lock:
+            conn = self._get_conn()
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT role, text, payload, created_at FROM messages WHERE channel = ? AND chat_id = ? ORDER BY id DESC LIMIT ?",
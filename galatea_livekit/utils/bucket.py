@@ -1,4 +1,5 @@
 import json
+import os
 from typing import Any, List, Optional
 from galatea_livekit.utils.paths import PathManager
 
@@ -11,8 +12,11 @@ class BucketStore:
         # Ensure key is a safe filename
         safe_key = "".join([c if c.isalnum() or c in ("-", "_") else "_" for c in key])
         filepath = self.bucket_dir / f"{safe_key}.json"
-        with open(filepath, "w", encoding="utf-8") as f:
+        # Write to a temp file then rename so readers never see a half-written object
+        tmp_path = filepath.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2)
+        os.replace(tmp_path, filepath)
         return str(filepath)
 
     def get(self, key: str) -> Optional[Any]:
@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+from collections import OrderedDict
 from typing import Any, Optional
 try:
     import redis
@@ -9,8 +10,11 @@ except ImportError:
 
 logger = logging.getLogger("galatea-cache")
 
+# Cap for the in-memory fallback; overridable for long-running daemons
+DEFAULT_MAX_ENTRIES = int(os.getenv("GALATEA_CACHE_MAX_ENTRIES", "512"))
+
 class Cache:
-    def __init__(self, host="localhost", port=6379, db=0):
+    def __init__(self, host="localhost", port=6379, db=0, max_entries: int = DEFAULT_MAX_ENTRIES):
         self._redis = None
         if redis:
             try:
@@ -24,19 +28,26 @@ class Cache:
         else:
             logger.warning("Redis package not installed. Falling back to in-memory cache.")
         
-        self._local_cache = {}
+        # In-memory fallback is a bounded LRU so a long-lived agent can't grow it forever
+        self._local_cache: OrderedDict = OrderedDict()
+        self._max_entries = max_entries
 
     def set(self, key: str, value: Any, expire: int = None):
         if self._redis:
             self._redis.set(key, json.dumps(value), ex=expire)
         else:
             self._local_cache[key] = value
+            self._local_cache.move_to_end(key)
+            while len(self._local_cache) > self._max_entries:
+                self._local_cache.popitem(last=False)
 
     def get(self, key: str) -> Optional[Any]:
         if self._redis:
             val = self._redis.get(key)
             return json.loads(val) if val else None
         else:
+            if key in self._local_cache:
+                self._local_cache.move_to_end(key)
             return self._local_cache.get(key)
 
     def delete(self, key: str):
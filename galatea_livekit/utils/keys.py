@@ -0,0 +1,30 @@
+import os
+from functools import lru_cache
+from typing import Optional, Tuple
+
+# Strips stray quote characters copied in from .env files in a single pass
+_QUOTES = str.maketrans("", "", "\"'")
+
+
+def clean_key(value: str) -> str:
+    """Strip whitespace and surrounding quote characters from a key value."""
+    return value.strip().translate(_QUOTES)
+
+
+@lru_cache(maxsize=32)
+def resolve_api_key(env_names: Tuple[str, ...], override: Optional[str] = None) -> Optional[str]:
+    """Resolve an API key from an explicit override or the first set env var.
+
+    Memoized per process: env vars don't change during a run, and plugin classes
+    may be reconstructed on every session, so repeated getenv + strip chains are
+    wasted work.
+    """
+    if override:
+        return clean_key(override) or None
+    for name in env_names:
+        val = os.getenv(name)
+        if val:
+            cleaned = clean_key(val)
+            if cleaned:
+                return cleaned
+    return None
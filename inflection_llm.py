@@ -21,6 +21,17 @@ from livekit.agents.types import (
 
 logger = logging.getLogger("inflection-llm")
 
+# Shared session: reusing the connection pool avoids a DNS lookup + TLS handshake
+# on every chat turn.
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def _get_session() -> aiohttp.ClientSession:
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+    return _session
+
 class InflectionLLM(LLM):
     def __init__(self, model: str = "Pi-3.1", api_key: Optional[str] = None):
         super().__init__()
@@ -95,45 +106,45 @@ class InflectionLLMStream(LLMStream):
             "Content-Type": "application/json"
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(self._api_url, json=payload, headers=headers) as resp:
-                if resp.status != 200:
-                    err_text = await resp.text()
-                    logger.error(f"Inflection API error: {resp.status} - {err_text}")
-                    return
+        session = _get_session()
+        async with session.post(self._api_url, json=payload, headers=headers) as resp:
+            if resp.status != 200:
+                err_text = await resp.text()
+                logger.error(f"Inflection API error: {resp.status} - {err_text}")
+                return
 
-                # Inflection API (based on provided curl) likely returns JSON.
-                # If it supports streaming, the curl usually would show headers or we'd know.
-                # The provided curl is basic. Let's assume non-streaming for now, 
-                # OR check if it returns SSE.
-                # Assuming simple JSON response for now based on standard inference APIs unless valid SSE headers.
-                # NOTE: LiveKit LLMStream expects chunks.
+            # Inflection API (based on provided curl) likely returns JSON.
+            # If it supports streaming, the curl usually would show headers or we'd know.
+            # The provided curl is basic. Let's assume non-streaming for now, 
+            # OR check if it returns SSE.
+            # Assuming simple JSON response for now based on standard inference APIs unless valid SSE headers.
+            # NOTE: LiveKit LLMStream expects chunks.
+            
+            try:
+                data = await resp.json()
+                # We need to find the text in the response.
+                # Commonly {"text": "..."} or similar. 
+                # Without response docs, I'll assume a 'text' field or similar.
+                # If the user says it works like Pi, maybe just 'text'.
+                
+                # Wait, if it's SSE, we iterate lines.
+                # Let's check generally if we can iterate chunks.
                 
-                try:
-                    data = await resp.json()
-                    # We need to find the text in the response.
-                    # Commonly {"text": "..."} or similar. 
-                    # Without response docs, I'll assume a 'text' field or similar.
-                    # If the user says it works like Pi, maybe just 'text'.
-                    
-                    # Wait, if it's SSE, we iterate lines.
-                    # Let's check generally if we can iterate chunks.
-                    
-                    full_text = data.get("text") # Guessing field name
-                    if not full_text:
-                         # Try 'response' or inspect keys
-                         logger.info(f"Inflection response keys: {data.keys()}")
-                         full_text = data.get("text", "") 
+                full_text = data.get("text") # Guessing field name
+                if not full_text:
+                     # Try 'response' or inspect keys
+                     logger.info(f"Inflection response keys: {data.keys()}")
+                     full_text = data.get("text", "") 
 
-                    # Stream it out as a single chunk if it's not actually streaming
-                    if full_text:
-                        self._output_chunk(llm.ChatChunk(
-                            choices=[
-                                llm.Choice(
-                                    delta=llm.ChoiceDelta(content=full_text, role="assistant"),
-                                    index=0
-                                )
-                            ]
-                        ))
-                except Exception as e:
-                    logger.error(f"Error parsing Inflection response: {e}")
+                # Stream it out as a single chunk if it's not actually streaming
+                if full_text:
+                    self._output_chunk(llm.ChatChunk(
+                        choices=[
+                            llm.Choice(
+                                delta=llm.ChoiceDelta(content=full_text, role="assistant"),
+                                index=0
+                            )
+                        ]
+                    ))
+            except Exception as e:
+                logger.error(f"Error parsing Inflection response: {e}")
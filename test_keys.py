@@ -4,11 +4,14 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Shared session: pooled connections instead of a fresh TLS handshake per check
+_session = requests.Session()
+
 def test_openai():
     key = os.getenv("OPENAI_API_KEY")
     if not key: return "MISSING"
     try:
-        r = requests.get("https://api.openai.com/v1/models", headers={"Authorization": f"Bearer {key}"}, timeout=10)
+        r = _session.get("https://api.openai.com/v1/models", headers={"Authorization": f"Bearer {key}"}, timeout=10)
         return "VALID" if r.status_code == 200 else f"FAILED ({r.status_code})"
     except Exception as e: return f"ERROR ({e})"
 
@@ -17,7 +20,7 @@ def test_anthropic():
     if not key: return "MISSING"
     try:
         # Anthropic doesn't have a simple GET user info, we'll try to list models if supported or just check auth
-        r = requests.get("https://api.anthropic.com/v1/models", headers={
+        r = _session.get("https://api.anthropic.com/v1/models", headers={
             "x-api-key": key,
             "anthropic-version": "2023-06-01"
         }, timeout=10)
@@ -28,7 +31,7 @@ def test_elevenlabs():
     key = os.getenv("ELEVEN_API_KEY") or os.getenv("ELEVENLABS_API_KEY")
     if not key: return "MISSING"
     try:
-        r = requests.get("https://api.elevenlabs.io/v1/user", headers={"xi-api-key": key}, timeout=10)
+        r = _session.get("https://api.elevenlabs.io/v1/user", headers={"xi-api-key": key}, timeout=10)
         return "VALID" if r.status_code == 200 else f"FAILED ({r.status_code})"
     except Exception as e: return f"ERROR ({e})"
 
@@ -36,7 +39,7 @@ def test_deepseek():
     key = os.getenv("DEEPSEEK_API_KEY")
     if not key: return "MISSING"
     try:
-        r = requests.get("https://api.deepseek.com/models", headers={"Authorization": f"Bearer {key}"}, timeout=10)
+        r = _session.get("https://api.deepseek.com/models", headers={"Authorization": f"Bearer {key}"}, timeout=10)
         return "VALID" if r.status_code == 200 else f"FAILED ({r.status_code})"
     except Exception as e: return f"ERROR ({e})"
 
@@ -44,7 +47,7 @@ def test_google():
     key = os.getenv("GOOGLE_API_KEY")
     if not key: return "MISSING"
     try:
-        r = requests.get(f"https://generativelanguage.googleapis.com/v1beta/models?key={key}", timeout=10)
+        r = _session.get(f"https://generativelanguage.googleapis.com/v1beta/models?key={key}", timeout=10)
         return "VALID" if r.status_code == 200 else f"FAILED ({r.status_code})"
     except Exception as e: return f"ERROR ({e})"
 
@@ -52,7 +55,7 @@ def test_hf():
     key = os.getenv("HF_TOKEN")
     if not key: return "MISSING"
     try:
-        r = requests.get("https://huggingface.co/api/whoami-v2", headers={"Authorization": f"Bearer {key}"}, timeout=10)
+        r = _session.get("https://huggingface.co/api/whoami-v2", headers={"Authorization": f"Bearer {key}"}, timeout=10)
         return "VALID" if r.status_code == 200 else f"FAILED ({r.status_code})"
     except Exception as e: return f"ERROR ({e})"
 
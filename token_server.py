@@ -1,7 +1,8 @@
 """
 LiveKit token server for frontend connection.
 
-Run with: uvicorn token_server:app --reload --port 8765
+Run with: uvicorn token_server:app --loop uvloop --http httptools --port 8765
+(falls back fine to the default loop/parser during development: --reload)
 
 Dev mode (create credentials.json and serve it):
   CREATE_CREDENTIALS_FILE=1 uvicorn token_server:app --port 8765
@@ -10,26 +11,40 @@ The frontend calls GET /api/token?room=ROOM&identity=USER to get a JWT, or
 GET /api/credentials in dev to use the pre-written credentials file.
 Uses LIVEKIT_URL, LIVEKIT_API_KEY, LIVEKIT_API_SECRET from .env.
 """
+import hashlib
 import json
 import os
+from contextlib import asynccontextmanager
 from datetime import timedelta
 from pathlib import Path
 
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
 from livekit.api.access_token import AccessToken, VideoGrants
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 load_dotenv()
 
 # Path for dev credentials file (same dir as this script)
 CREDENTIALS_FILE = Path(__file__).resolve().parent / "credentials.json"
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    _ensure_credentials_file()
+    yield
+
+
 app = FastAPI(
     title="LiveKit Token API",
     description="Issue LiveKit access tokens for the voice agent frontend.",
+    lifespan=_lifespan,
 )
 
 # Allow frontend (different origin) to call this API
@@ -65,45 +80,73 @@ def _get_livekit_url() -> str:
     return url
 
 
+# Resolved once at import (after load_dotenv): env vars don't change during a run,
+# so per-request getenv + URL surgery is wasted work on the /api/token hot path.
+_API_KEY = os.getenv("LIVEKIT_API_KEY")
+_API_SECRET = os.getenv("LIVEKIT_API_SECRET")
+try:
+    _LIVEKIT_URL: str | None = _get_livekit_url()
+except ValueError:
+    _LIVEKIT_URL = None
+
+
 def _ensure_credentials_file() -> None:
     """Create credentials.json when CREATE_CREDENTIALS_FILE=1 (dev mode)."""
     if os.getenv("CREATE_CREDENTIALS_FILE", "").strip().lower() not in ("1", "true", "yes"):
         return
-    api_key = os.getenv("LIVEKIT_API_KEY")
-    api_secret = os.getenv("LIVEKIT_API_SECRET")
-    if not api_key or not api_secret:
-        return
-    try:
-        livekit_url = _get_livekit_url()
-    except ValueError:
+    if not _API_KEY or not _API_SECRET or not _LIVEKIT_URL:
         return
     token = (
-        AccessToken(api_key=api_key, api_secret=api_secret)
+        AccessToken(api_key=_API_KEY, api_secret=_API_SECRET)
         .with_identity("user")
         .with_grants(VideoGrants(room_join=True, room="voice-room"))
         .with_ttl(timedelta(hours=1))
     )
-    payload = {"token": token.to_jwt(), "url": livekit_url}
-    CREDENTIALS_FILE.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    payload = {"token": token.to_jwt(), "url": _LIVEKIT_URL}
+    if orjson:
+        CREDENTIALS_FILE.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        # Stream into the file handle; avoids materializing the serialized string twice
+        with CREDENTIALS_FILE.open("w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
 
 
-@app.on_event("startup")
-def _on_startup() -> None:
-    _ensure_credentials_file()
+# Parsed credentials cache keyed by file mtime; the file changes at most once per
+# startup, so steady-state requests cost a single stat instead of read + parse.
+_cred_cache: tuple[int, TokenResponse, str] | None = None
+
+
+def _etag_for(payload_bytes: bytes) -> str:
+    return hashlib.blake2b(payload_bytes, digest_size=8).hexdigest()
 
 
 @app.get("/api/credentials", response_model=TokenResponse)
-def get_credentials():
+def get_credentials(request: Request, response: Response):
     """Serve pre-written credentials from credentials.json (dev). Frontend uses this when available."""
-    if not CREDENTIALS_FILE.exists():
-        raise HTTPException(status_code=404, detail="credentials.json not found (run with CREATE_CREDENTIALS_FILE=1)")
+    global _cred_cache
     try:
-        data = json.loads(CREDENTIALS_FILE.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError) as e:
-        raise HTTPException(status_code=500, detail=f"Invalid credentials file: {e}") from e
-    if "token" not in data or "url" not in data:
-        raise HTTPException(status_code=500, detail="credentials.json must contain 'token' and 'url'")
-    return TokenResponse(token=data["token"], url=data["url"])
+        stat = CREDENTIALS_FILE.stat()
+    except OSError:
+        raise HTTPException(status_code=404, detail="credentials.json not found (run with CREATE_CREDENTIALS_FILE=1)")
+    if _cred_cache is not None and _cred_cache[0] == stat.st_mtime_ns:
+        resp, etag = _cred_cache[1], _cred_cache[2]
+    else:
+        try:
+            raw = CREDENTIALS_FILE.read_bytes()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+        except (json.JSONDecodeError, OSError) as e:
+            raise HTTPException(status_code=500, detail=f"Invalid credentials file: {e}") from e
+        if "token" not in data or "url" not in data:
+            raise HTTPException(status_code=500, detail="credentials.json must contain 'token' and 'url'")
+        resp = TokenResponse(token=data["token"], url=data["url"])
+        etag = _etag_for(raw)
+        _cred_cache = (stat.st_mtime_ns, resp, etag)
+    # Let the frontend revalidate cheaply instead of re-fetching the same blob
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, max-age=30"
+    return resp
 
 
 @app.get("/api/token", response_model=TokenResponse)
@@ -114,20 +157,16 @@ def get_token(
     name: str | None = None,
 ):
     """Issue a LiveKit access token so the frontend can join a room."""
-    api_key = os.getenv("LIVEKIT_API_KEY")
-    api_secret = os.getenv("LIVEKIT_API_SECRET")
-    if not api_key or not api_secret:
+    if not _API_KEY or not _API_SECRET:
         raise HTTPException(
             status_code=500,
             detail="LiveKit API key/secret not configured (LIVEKIT_API_KEY, LIVEKIT_API_SECRET)",
         )
-    try:
-        livekit_url = _get_livekit_url()
-    except ValueError as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    if not _LIVEKIT_URL:
+        raise HTTPException(status_code=500, detail="LIVEKIT_URL is not set in environment")
 
     token = (
-        AccessToken(api_key=api_key, api_secret=api_secret)
+        AccessToken(api_key=_API_KEY, api_secret=_API_SECRET)
         .with_identity(identity)
         .with_grants(VideoGrants(room_join=True, room=room))
         .with_ttl(timedelta(hours=1))
@@ -136,7 +175,7 @@ def get_token(
         token = token.with_name(name)
     jwt_token = token.to_jwt()
 
-    return TokenResponse(token=jwt_token, url=livekit_url)
+    return TokenResponse(token=jwt_token, url=_LIVEKIT_URL)
 
 
 @app.post("/api/token/body", response_model=TokenResponse)
@@ -145,11 +184,16 @@ def get_token_body(body: TokenRequest):
     return get_token(room=body.room, identity=body.identity, name=body.name)
 
 
+# The health payload never changes for the process lifetime; precompute it and its ETag
+_HEALTH_PAYLOAD = {"ok": True, "livekit_url_set": bool(_LIVEKIT_URL)}
+_HEALTH_ETAG = hashlib.blake2b(json.dumps(_HEALTH_PAYLOAD, sort_keys=True).encode(), digest_size=8).hexdigest()
+
+
 @app.get("/api/health")
-def health():
+def health(request: Request, response: Response):
     """Health check; confirms LIVEKIT_URL is set."""
-    try:
-        url = _get_livekit_url()
-        return {"ok": True, "livekit_url_set": bool(url)}
-    except ValueError:
-        return {"ok": True, "livekit_url_set": False}
+    if request.headers.get("if-none-match") == _HEALTH_ETAG:
+        return Response(status_code=304)
+    response.headers["ETag"] = _HEALTH_ETAG
+    response.headers["Cache-Control"] = "private, max-age=30"
+    return _HEALTH_PAYLOAD